@@ -1 +1 @@
-from .mapper import Mapper
\ No newline at end of file
+from .mapper import Mapper
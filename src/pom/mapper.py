@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from collections import ChainMap, defaultdict
 from collections.abc import Iterable
-from functools import partial
-from inspect import Parameter, getmembers, isclass, signature
+from dataclasses import _FIELD_CLASSVAR, MISSING, is_dataclass
+from functools import lru_cache, wraps
+from inspect import Parameter, isclass, signature
+from operator import attrgetter
+from sys import intern
+from weakref import WeakKeyDictionary
 from typing import (
     Any,
     Callable,
@@ -30,6 +33,168 @@ except ImportError:
 TS = TypeVar("TS")
 TT = TypeVar("TT")
 
+
+def _per_class_cache(fn):
+    """Memoize a helper taking a single class argument, without pinning it.
+
+    Behaves like ``lru_cache`` but stores results in a ``WeakKeyDictionary``,
+    so ephemeral classes (e.g. defined inside a function) drop out of the
+    cache when they are collected instead of being kept alive forever.
+    """
+    cache: "WeakKeyDictionary[type, Any]" = WeakKeyDictionary()
+
+    @wraps(fn)
+    def wrapper(cls: type):
+        try:
+            return cache[cls]
+        except KeyError:
+            value = cache[cls] = fn(cls)
+            return value
+
+    return wrapper
+
+
+def _has_generated_dataclass_init(cls: type) -> bool:
+    """True when ``cls.__init__`` is the one dataclasses generated.
+
+    ``init=False`` dataclasses and those with a hand-written ``__init__``
+    keep their real signature, so the ``__dataclass_fields__`` shortcuts
+    must not run for them. Generated methods compile from synthesized
+    source (``<string>``); anything else falls back to signature parsing,
+    which is always correct.
+    """
+    if not cls.__dataclass_params__.init:
+        return False
+    code = getattr(cls.__init__, "__code__", None)
+    return code is not None and code.co_filename == "<string>"
+
+
+@_per_class_cache
+def _init_params(cls: type) -> Tuple[Tuple[str, Parameter], ...]:
+    """Cached ``__init__`` parameters of a class, minus self/args/kwargs.
+
+    ``inspect.signature`` rebuilds Parameter objects on every call, which
+    dominates the hot mapping path; the result is constant per class.
+    """
+    if is_dataclass(cls) and _has_generated_dataclass_init(cls):
+        # The generated __init__ mirrors __dataclass_fields__; build the
+        # parameters from the fields instead of parsing the signature.
+        params = []
+        for name, field in cls.__dataclass_fields__.items():
+            # ClassVar pseudo-fields live in __dataclass_fields__ but are not
+            # __init__ parameters (InitVar entries are, so they stay).
+            if field._field_type is _FIELD_CLASSVAR:
+                continue
+            if not field.init:
+                continue
+            if field.default is not MISSING:
+                default = field.default
+            elif field.default_factory is not MISSING:
+                default = field.default_factory
+            else:
+                default = Parameter.empty
+            params.append(
+                (
+                    name,
+                    Parameter(name, Parameter.POSITIONAL_OR_KEYWORD, default=default),
+                )
+            )
+        return tuple(params)
+    params = iter(signature(cls.__init__).parameters.items())
+    next(params, None)  # the first parameter is always self
+    return tuple(
+        (name, param)
+        for name, param in params
+        if param.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+    )
+
+
+_COLLECTION_TYPES = (tuple, list, set, frozenset)
+
+
+def _is_multi_source(obj: Any) -> bool:
+    """True when ``obj`` bundles several sources.
+
+    Checks the concrete builtin collection types first; isinstance against
+    ``collections.abc.Iterable`` goes through the ABC subclass hook and is
+    much slower, so it is kept only as fallback for user-defined iterables.
+    """
+    obj_type = type(obj)
+    if obj_type is tuple:
+        # Tuples are the documented way to pass multiple sources.
+        return True
+    if obj_type in _COLLECTION_TYPES:
+        return True
+    return isinstance(obj, Iterable) and not isinstance(obj, (str, bytes))
+
+
+@_per_class_cache
+def _public_attr_names(cls: type) -> Tuple[str, ...]:
+    """Cached public attribute names reachable through a class."""
+    return tuple(name for name in dir(cls) if not name.startswith("_"))
+
+
+@_per_class_cache
+def _public_attr_getter(cls: type) -> Optional[Callable[[Any], tuple]]:
+    """Cached ``attrgetter`` bundling all public class-level names.
+
+    ``attrgetter`` fetches every name in a single C call, replacing one
+    Python-level ``getattr`` per attribute. ``None`` when the class exposes
+    no public names.
+    """
+    names = _public_attr_names(cls)
+    if not names:
+        return None
+    if len(names) == 1:
+        # attrgetter returns a bare value for a single name; normalize to a
+        # tuple so callers can zip uniformly.
+        single = attrgetter(names[0])
+        return lambda obj: (single(obj),)
+    return attrgetter(*names)
+
+
+# Descriptors CPython installs on every plain class; they never intercept
+# ordinary attribute writes, so they must not disable the bulk-set path.
+_IMPLICIT_DESCRIPTOR_NAMES = frozenset(("__dict__", "__weakref__"))
+
+
+@_per_class_cache
+def _supports_bulk_set(cls: type) -> bool:
+    """True when instance attributes can be written via ``__dict__.update``.
+
+    Bulk updates bypass descriptors and ``__setattr__`` overrides, so the
+    fast path is only taken for plain classes: default ``__setattr__``, a
+    regular instance ``__dict__``, and no user-defined data descriptors in
+    the MRO (the implicit ``__dict__``/``__weakref__`` slots and ``object``'s
+    own getsets don't count).
+    """
+    if getattr(cls, "__setattr__", None) is not object.__setattr__:
+        return False
+    if getattr(cls, "__dictoffset__", 0) == 0:
+        return False
+    return not any(
+        hasattr(value, "__set__")
+        for klass in cls.__mro__
+        if klass is not object
+        for name, value in vars(klass).items()
+        if name not in _IMPLICIT_DESCRIPTOR_NAMES
+    )
+
+
+@_per_class_cache
+def _init_param_names(cls: type) -> frozenset:
+    """Cached frozenset of ``__init__`` parameter names of a class."""
+    return frozenset(name for name, _ in _init_params(cls))
+
+
+@_per_class_cache
+def _class_source_attr_names(cls: type) -> frozenset:
+    """Cached public attribute plus ``__init__`` parameter names of a class."""
+    names = set(_public_attr_names(cls))
+    names.update(name for name, _ in _init_params(cls))
+    return frozenset(names)
+
+
 SourceType = Union[Type[TS], Tuple[Type[TS], ...]]
 TargetType = Type[TT]
 Source = Union[TS, Tuple[TS]]
@@ -40,27 +205,27 @@ MappingSpec = Union[MappingDict, Set[str]]
 
 class PopoAdapter:
 
-    def __init__(self, exclusions) -> None:
-        self.exclusions = exclusions
+    __slots__ = ()
 
     def get_init_params(self, obj: Union[Type, Any]) -> Set[Tuple[str, Any]]:
-        return {
-            (name, param)
-            for name, param in signature(obj.__init__).parameters.items()
-            if name not in ["self", "args", "kwargs"]
-        }
+        return set(_init_params(obj if isclass(obj) else type(obj)))
 
     def get_source_attrs_names(self, source: Any) -> Set[str]:
-        if isinstance(source, Iterable) and not isinstance(source, (str, bytes)):
+        if _is_multi_source(source):
             names = set()
             for s in source:
-                pub = self.get_public_attrs(s)
-                init = self.get_init_params(s)
-                names |= {name for name, _ in pub} | {name for name, _ in init}
+                names |= self._source_attrs_names(s)
             return names
-        pub = self.get_public_attrs(source)
-        init = self.get_init_params(source)
-        return {name for name, _ in pub} | {name for name, _ in init}
+        return self._source_attrs_names(source)
+
+    def _source_attrs_names(self, source: Any) -> Set[str]:
+        cls = source if isclass(source) else type(source)
+        names = set(_class_source_attr_names(cls))
+        if not isclass(source):
+            instance_dict = getattr(source, "__dict__", None)
+            if isinstance(instance_dict, dict):
+                names.update(name for name in instance_dict if not name.startswith("_"))
+        return names
 
     def get_source_type(self, source_instance: Any) -> SourceType:
         return (
@@ -74,37 +239,52 @@ class PopoAdapter:
         obj: Any,
     ) -> bool:
         # Default: treat any iterable (except strings/bytes) as multiple sources
-        if isinstance(obj, Iterable) and not isinstance(obj, (str, bytes)):
-            return True
-        # Single source
-        return False
+        return _is_multi_source(obj)
 
     def select_attrs(
         self,
         source: TS,
-        source_type: Union[Type[TS], Tuple[Type[TS], ...]],
-        target_type: Type[TT],
+        exclusions: frozenset,
     ) -> Dict[str, Any]:
-        return dict(
-            self._filter_out_excluded_attrs(
-                self.get_public_attrs(source), source_type, target_type
-            )
-        )
-
-    def _filter_out_excluded_attrs(
-        self,
-        attrs: List[Tuple[str, Any]],
-        source_type: Union[Type[TS], Tuple[Type[TS], ...]],
-        target_type: Type[TT],
-    ) -> List[Tuple[str, Any]]:
-        return [
-            attr
-            for attr in attrs
-            if attr[0] not in self.exclusions[source_type][target_type]
-        ]
+        # The caller hands over the plan's frozen exclusion set, so there is
+        # no per-call registry lookup and the no-exclusions case is a plain
+        # dict build.
+        attrs = self.get_public_attrs(source)
+        if not exclusions:
+            return dict(attrs)
+        return {name: value for name, value in attrs if name not in exclusions}
 
     def get_public_attrs(self, obj: Any) -> List[Tuple[str, Any]]:
-        return [attr for attr in getmembers(obj) if not attr[0].startswith("_")]
+        # getmembers(obj) walks the full MRO and getattrs every name (dunders
+        # included) on each call; iterate the cached class-level names plus the
+        # instance __dict__ instead.
+        cls = obj if isclass(obj) else type(obj)
+        class_names = _public_attr_names(cls)
+        getter = _public_attr_getter(cls)
+        if getter is None:
+            attrs = []
+        else:
+            try:
+                attrs = list(zip(class_names, getter(obj)))
+            except AttributeError:
+                # Some class-level name is unreadable on this object (e.g. a
+                # raising property); fall back to fetching one by one.
+                attrs = []
+                for name in class_names:
+                    try:
+                        attrs.append((name, getattr(obj, name)))
+                    except AttributeError:
+                        continue
+        if not isclass(obj):
+            instance_dict = getattr(obj, "__dict__", None)
+            if isinstance(instance_dict, dict):
+                seen = set(class_names)
+                attrs.extend(
+                    (name, value)
+                    for name, value in instance_dict.items()
+                    if not name.startswith("_") and name not in seen
+                )
+        return attrs
 
     def get_attrs_names(self, attrs: Iterable[Tuple[str, Any]]) -> Set[str]:
         return {name for name, _ in attrs}
@@ -118,9 +298,23 @@ class PopoAdapter:
             if param.default is Parameter.empty
         }
 
-    def set_attrs(self, instance: TT, attrs: Mapping[str, Any]) -> TT:
+    def set_attrs(
+        self,
+        instance: TT,
+        attrs: Mapping[str, Any],
+        extra: Optional[Mapping[str, Any]] = None,
+    ) -> TT:
+        if _supports_bulk_set(type(instance)):
+            # One C-level dict merge instead of N setattr dispatches.
+            instance.__dict__.update(attrs)
+            if extra:
+                instance.__dict__.update(extra)
+            return instance
         for name, value in attrs.items():
             setattr(instance, name, value)
+        if extra:
+            for name, value in extra.items():
+                setattr(instance, name, value)
         return instance
 
     def create_instance(self, cls: Type[TT]) -> TT:
@@ -128,8 +322,10 @@ class PopoAdapter:
 
 
 class PydanticModelAdapter(PopoAdapter):
-    def __init__(self, exclusions: Any, BaseModel: Type) -> None:
-        super().__init__(exclusions)
+
+    __slots__ = ("BaseModel",)
+
+    def __init__(self, BaseModel: Type) -> None:
         self.BaseModel = BaseModel
 
     def get_public_attrs(self, obj: Any) -> List[Tuple[str, Any]]:
@@ -179,7 +375,7 @@ class PydanticModelAdapter(PopoAdapter):
             or isinstance(obj, self.BaseModel)
         ):
             return False
-        elif isinstance(obj, Iterable) and not isinstance(obj, (str, bytes)):
+        elif _is_multi_source(obj):
             return True
         raise TypeError(
             f"Expected a BaseModel instance, class or a collection of them, got {type(obj).__name__}"
@@ -202,17 +398,113 @@ class PydanticModelAdapter(PopoAdapter):
         )
 
 
-def prop():
-    def prop(x):
-        return x
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _format_missing_attrs_message(
+    missing_attributes: frozenset, source_name: str
+) -> str:
+    """Format (and memoize) the missing-mapping-attributes message.
+
+    Registering the same broken mapping repeatedly re-raises an identical
+    message; caching skips the re-sort and re-format after the first one.
+    """
+    names = sorted(missing_attributes)
+    if len(names) <= 1:
+        attributes_string = f"attribute {''.join(names)}"
+    else:
+        attributes_string = f"attributes {', '.join(names[:-1])} and {names[-1]}"
+    return f"Mapping {attributes_string} not found in source {source_name}."
+
+
+_ERR_SINGLE = (
+    "Source object {src} is missing required properties "
+    "for target object {tgt}: {err}"
+)
+_ERR_AGG = (
+    "Source objects ({srcs}) are missing required properties "
+    "for target object {tgt}: {err}"
+)
 
-    return prop
+
+class _MappingPlan:
+    """Precompiled state for one (source type, target type) pair.
+
+    Everything stored here is invariant between ``add_mapping`` calls, so
+    ``map`` can resolve it with a single dict lookup instead of redoing the
+    registry traversal and exclusion-set construction on every call. The
+    mapping rules are compiled once into a specialized applier function, so
+    applying them is straight-line code with no per-attribute dispatch.
+    """
+
+    __slots__ = ("exclusions", "apply")
+
+    def __init__(self, mapping: MappingDict, exclusions: frozenset) -> None:
+        self.exclusions = exclusions
+        self.apply: Optional[Callable[[Mapping[str, Any]], Dict[str, Any]]] = (
+            self._compile(mapping) if mapping else None
+        )
+
+    @staticmethod
+    def _compile(mapping: MappingDict) -> Callable[[Mapping[str, Any]], Dict[str, Any]]:
+        # Generate one straight-line function per plan, the way dataclasses
+        # generate __init__: unmapped attributes are bulk-copied, each mapped
+        # attribute becomes a literal get/transform/store sequence.
+        namespace: Dict[str, Any] = {
+            "_mapped": frozenset(mapping),
+            "_MISSING": _MISSING,
+        }
+        lines = [
+            "def _apply(attrs):",
+            "    result = {k: v for k, v in attrs.items() if k not in _mapped}",
+        ]
+        for index, (name, transform) in enumerate(mapping.items()):
+            if callable(transform):
+                target_name, fn = name, transform
+            elif isinstance(transform, str):
+                target_name, fn = transform, None
+            elif isinstance(transform, tuple):
+                target_name, fn = transform
+            else:
+                raise ValueError(f"Unsupported transform type for property '{name}'.")
+            lines.append(f"    value = attrs.get({name!r}, _MISSING)")
+            lines.append("    if value is not _MISSING:")
+            if fn is None:
+                lines.append(f"        result[{target_name!r}] = value")
+            else:
+                fn_name = f"_transform_{index}"
+                namespace[fn_name] = fn
+                lines.append(f"        result[{target_name!r}] = {fn_name}(value)")
+        lines.append("    return result")
+        exec(compile("\n".join(lines), "<pom mapping plan>", "exec"), namespace)
+        return namespace["_apply"]
 
 
 class Mapper:
+
+    __slots__ = (
+        "mappings",
+        "exclusions",
+        "_plans",
+        "_required_init_params",
+        "_popo_adapter",
+        "_pydantic_adapter",
+    )
+
     def __init__(self) -> None:
-        self.mappings = defaultdict(partial(defaultdict, partial(defaultdict, prop)))
-        self.exclusions = defaultdict(partial(defaultdict, list))
+        self.mappings: Dict[Tuple[Any, Any], MappingDict] = {}
+        self.exclusions: Dict[Tuple[Any, Any], Set[str]] = {}
+        # Keyed weakly on the target class so plans compiled for ephemeral
+        # (e.g. locally defined) classes do not outlive them.
+        self._plans: "WeakKeyDictionary[type, Dict[Any, _MappingPlan]]" = (
+            WeakKeyDictionary()
+        )
+        self._required_init_params: "WeakKeyDictionary[type, Set[str]]" = (
+            WeakKeyDictionary()
+        )
+        self._popo_adapter = PopoAdapter()
+        self._pydantic_adapter: Optional[PydanticModelAdapter] = None
 
     def add_mapping(
         self,
@@ -228,8 +520,28 @@ class Mapper:
             mapping = {name: name for name in mapping}
         adapter = self.get_adapter(source)
         source_type = adapter.get_source_type(source)
-        self.mappings[source_type][target].update(mapping or {})
-        self.exclusions[source_type][target].extend(exclusions or set())
+        key = (source_type, target)
+        # Intern the names once at registration; interned strings compare by
+        # pointer in dict and attribute lookups on every subsequent map().
+        self.mappings.setdefault(key, {}).update(
+            (intern(name), self._intern_transform(transform))
+            for name, transform in mapping.items()
+        )
+        self.exclusions.setdefault(key, set()).update(
+            intern(name) for name in exclusions or ()
+        )
+        plans_for_target = self._plans.get(target)
+        if plans_for_target is not None:
+            plans_for_target.pop(source_type, None)
+
+    @staticmethod
+    def _intern_transform(transform: Any) -> Any:
+        # Rename targets are strings too; intern them alongside the keys.
+        if isinstance(transform, str):
+            return intern(transform)
+        if isinstance(transform, tuple) and transform and isinstance(transform[0], str):
+            return (intern(transform[0]),) + transform[1:]
+        return transform
 
     def map(
         self,
@@ -246,35 +558,43 @@ class Mapper:
             skip_init: Skip __init__ when creating target instance
             extra: Additional attributes to set on target instance
         """
-        extra = extra or {}
-        target_is_type = isclass(target)
+        # Normalize falsy extra to None once so no empty dict is allocated
+        # and downstream code can branch on a plain identity check.
+        extra = extra if extra else None
+        # inspect.isclass is just isinstance(obj, type) behind a function
+        # call; use the direct check on the hot path.
+        target_is_type = isinstance(target, type)
         target_type: type[TT] = target if target_is_type else type(target)
         skip_init = skip_init or not target_is_type
         adapter = self.get_adapter(source)
-        source_type = adapter.get_source_type(source)
-
-        self._guard_no_required_attrs_excluded(
-            source, target_type, source_type, extra, target
-        )
-
-        # Get source properties
-        source_attrs = self._create_source_attrs_chain_map(
-            source, source_type, target_type
-        )
-
-        # Get mapping rules
-        mapping = self.mappings[source_type][target_type]
+        # Decide the source shape once; each executor then runs without any
+        # further collection checks.
+        if adapter.is_collection(source):
+            return self._map_multi(
+                adapter, source, target, target_type, skip_init, extra
+            )
+        return self._map_single(adapter, source, target, target_type, skip_init, extra)
 
-        # Apply mappings
-        mapped_attrs = self._map(mapping, source_attrs, extra)
+    def map_many(
+        self,
+        sources: Iterable[Source],
+        target: Union[TT, type[TT]],
+        skip_init: bool = False,
+        extra: Optional[dict] = None,
+    ) -> List[TT]:
+        """Map a batch of source objects to target type.
 
-        return self._build_target(
-            skip_init,
-            target,
-            mapped_attrs,
-            target_type,
-            source,
-        )
+        Args:
+            sources: Iterable of source objects (or tuples of source objects
+                for aggregate mappings) to map from
+            target: Type to map each source to
+            skip_init: Skip __init__ when creating target instances
+            extra: Additional attributes to set on every target instance
+        """
+        return [
+            self.map(source, target, skip_init=skip_init, extra=extra)
+            for source in sources
+        ]
 
     def get_adapter(self, obj: Any):
         if BaseModel is not None and (
@@ -287,96 +607,139 @@ class Mapper:
                 and all(isinstance(item, BaseModel) for item in obj)
             )
         ):
-            return PydanticModelAdapter(self.exclusions, BaseModel)
-        return PopoAdapter(self.exclusions)
+            # Reuse the adapter instance; rebuild only if the module-level
+            # BaseModel reference changed (e.g. patched in tests).
+            adapter = self._pydantic_adapter
+            if adapter is None or adapter.BaseModel is not BaseModel:
+                adapter = PydanticModelAdapter(BaseModel)
+                self._pydantic_adapter = adapter
+            return adapter
+        return self._popo_adapter
 
     # region Private methods
     # These methods are not intended to be used outside of this class.
 
-    def _map(
-        self, mappings: MappingDict, attrs: Mapping[str, Any], extra: Dict[str, Any]
-    ) -> Mapping[str, Any]:
-        result = []
-        for prop_name, prop_value in attrs.items():
-            transform = mappings[prop_name]
-            if callable(transform):
-                mapped_value = transform(prop_value)
-                result.append((prop_name, mapped_value))
-            elif isinstance(transform, str):
-                result.append((transform, prop_value))
-            elif isinstance(transform, tuple):
-                result.append((transform[0], transform[1](prop_value)))
-            else:
-                raise ValueError(
-                    f"Unsupported transform type for property '{prop_name}'."
-                )
-
-        return ChainMap(extra, dict(result))
+    def _map_single(
+        self,
+        adapter: PopoAdapter,
+        source: TS,
+        target: Union[TT, Type[TT]],
+        target_type: Type[TT],
+        skip_init: bool,
+        extra: Optional[Dict[str, Any]],
+    ) -> TT:
+        source_type = source if isinstance(source, type) else type(source)
+        plan = self._get_plan(source_type, target_type)
+        self._guard_no_required_attrs_excluded(
+            source, target_type, plan.exclusions, extra, target
+        )
+        source_attrs = adapter.select_attrs(source, plan.exclusions)
+        mapped_attrs = self._map(plan, source_attrs)
+        return self._build_target(
+            skip_init, target, mapped_attrs, extra, target_type, source_type
+        )
 
-    def _create_source_attrs_chain_map(
+    def _map_multi(
         self,
-        source: Any,
-        source_type: Any,
-        target_type: Any,
-    ) -> ChainMap:
-        adapter = self.get_adapter(source)
+        adapter: PopoAdapter,
+        source: Tuple[TS, ...],
+        target: Union[TT, Type[TT]],
+        target_type: Type[TT],
+        skip_init: bool,
+        extra: Optional[Dict[str, Any]],
+    ) -> TT:
+        # The caller already established the multi-source shape; build the
+        # type tuple directly instead of re-dispatching through the adapter.
+        source_type = tuple(so if isinstance(so, type) else type(so) for so in source)
+        plan = self._get_plan(source_type, target_type)
+        self._guard_no_required_attrs_excluded(
+            source, target_type, plan.exclusions, extra, target
+        )
+        # Merge right-to-left so earlier sources keep precedence.
+        source_attrs: Dict[str, Any] = {}
+        for so in reversed(list(source)):
+            source_attrs.update(adapter.select_attrs(so, plan.exclusions))
+        mapped_attrs = self._map(plan, source_attrs)
+        return self._build_target(
+            skip_init, target, mapped_attrs, extra, target_type, source_type
+        )
 
-        if adapter.is_collection(source):
-            return ChainMap(
-                *[adapter.select_attrs(so, source_type, target_type) for so in source]
+    def _get_plan(self, source_type: Any, target_type: Any) -> _MappingPlan:
+        plans_for_target = self._plans.get(target_type)
+        if plans_for_target is None:
+            plans_for_target = self._plans[target_type] = {}
+        plan = plans_for_target.get(source_type)
+        if plan is None:
+            key = (source_type, target_type)
+            plan = _MappingPlan(
+                self.mappings.get(key, {}),
+                frozenset(self.exclusions.get(key, ())),
             )
-        # Single source
-        return ChainMap(adapter.select_attrs(source, source_type, target_type))
+            plans_for_target[source_type] = plan
+        return plan
+
+    def _map(self, plan: _MappingPlan, attrs: Mapping[str, Any]) -> Dict[str, Any]:
+        apply = plan.apply
+        return dict(attrs) if apply is None else apply(attrs)
 
     def _build_target(
         self,
         skip_init: bool,
         target: Union[TT, Type[TT]],
         mapped_attrs: Mapping[str, Any],
+        extra: Optional[Dict[str, Any]],
         target_type: Type[TT],
-        source_instance: Union[TS, Tuple[TS, ...]],
+        source_type: SourceType,
     ) -> TT:
         # Create target instance
         adapter = self.get_adapter(target)
         try:
             if skip_init:
-                if not isclass(target):
-                    return adapter.set_attrs(target, mapped_attrs)
+                if not isinstance(target, type):
+                    return adapter.set_attrs(target, mapped_attrs, extra)
                 else:
                     target_instance = adapter.create_instance(target_type)
-                    return adapter.set_attrs(target_instance, mapped_attrs)
-            return self._initialize_target(mapped_attrs, target_type)
+                    return adapter.set_attrs(target_instance, mapped_attrs, extra)
+            return self._initialize_target(mapped_attrs, extra, target_type)
         except TypeError as e:
-            self._handle_mapping_error(source_instance, target_type, e)
+            self._handle_mapping_error(source_type, target_type, e)
         except AttributeError as e:
             raise
 
     def _initialize_target(
         self,
         mapped_attrs: Mapping[str, Any],
+        extra: Optional[Dict[str, Any]],
         target_type: Type[TT],
     ) -> TT:
         adapter = self.get_adapter(target_type)
-        return target_type(
-            **{
-                k: v
-                for k, v in mapped_attrs.items()
-                if k
-                in set(adapter.get_attrs_names(adapter.get_init_params(target_type)))
-            },
-        )
+        if adapter is self._popo_adapter:
+            # Plain classes: the parameter-name frozenset is type-constant,
+            # so skip rebuilding the (name, Parameter) set on every call.
+            init_names = _init_param_names(target_type)
+        else:
+            # Pydantic targets resolve names through field aliases.
+            init_names = adapter.get_attrs_names(adapter.get_init_params(target_type))
+        kwargs = {k: v for k, v in mapped_attrs.items() if k in init_names}
+        if extra:
+            # Extra values override mapped ones.
+            for k, v in extra.items():
+                if k in init_names:
+                    kwargs[k] = v
+        return target_type(**kwargs)
 
     def _guard_no_required_attrs_excluded(
         self,
         source_instance: Union[TS, Tuple[TS, ...]],
         target_type: Type[TT],
-        source_type: Union[Type[TS], Tuple[Type[TS], ...]],
-        extra: Dict[str, Any],
+        exclusions: frozenset,
+        extra: Optional[Dict[str, Any]],
         target: Union[TT, Type[TT]],
     ) -> None:
-        missing_attrs_candidates = set(self.exclusions[source_type][target_type]) - set(
-            extra.keys()
-        )
+        if not exclusions:
+            # Common case: nothing excluded, skip the whole introspection.
+            return
+        missing_attrs_candidates = exclusions - extra.keys() if extra else exclusions
 
         target_required_attrs = self._get_target_required_init_params_names(target)
 
@@ -389,11 +752,33 @@ class Mapper:
     def _get_target_required_init_params_names(
         self, target: Union[TT, Type[TT]]
     ) -> Set[str]:
+        # For class targets the result is type-constant; instance targets are
+        # computed fresh because their own attributes shrink the required set.
+        if isclass(target):
+            cached = self._required_init_params.get(target)
+            if cached is not None:
+                return cached
+            if is_dataclass(target) and _has_generated_dataclass_init(target):
+                # __dataclass_fields__ already knows which fields lack
+                # defaults; no signature inspection needed.
+                required = {
+                    name
+                    for name, field in target.__dataclass_fields__.items()
+                    if field._field_type is not _FIELD_CLASSVAR
+                    and field.init
+                    and field.default is MISSING
+                    and field.default_factory is MISSING
+                }
+                self._required_init_params[target] = required
+                return required
+
         adapter = self.get_adapter(target)
         t_props_names = adapter.get_attrs_names(
             adapter.filter_empty_params(adapter.get_init_params(target))
         ) - adapter.get_attrs_names(adapter.get_public_attrs(target))
 
+        if isclass(target):
+            self._required_init_params[target] = t_props_names
         return t_props_names
 
     def _guard_source_has_all_attrs_specified_in_mapping(
@@ -404,10 +789,10 @@ class Mapper:
 
         mapping_attrs_names = self._get_mapping_attrs_names(mapping)
         adapter = self.get_adapter(source)
-        source_attrs_names = adapter.get_source_attrs_names(source)
-        missing_attributes = {
-            attr for attr in mapping_attrs_names if attr not in source_attrs_names
-        }
+        # One C-level set difference instead of a per-name membership loop.
+        missing_attributes = mapping_attrs_names - adapter.get_source_attrs_names(
+            source
+        )
 
         if missing_attributes:
             self._raise_missing_attrs_error(source, missing_attributes)
@@ -424,22 +809,10 @@ class Mapper:
     def _raise_missing_attrs_error(
         self, source: Union[SourceType, TS], missing_attributes: Set[str]
     ) -> NoReturn:
-        sorted_missing_attributes = sorted(missing_attributes)
-        source_name = self._get_source_class_name(source)
-        if isinstance(source_name, str):
-            source_name_string = f"source {source_name}"
-        elif isinstance(source_name, Iterable):
-            source_name_string = (
-                f"sources {', '.join(source_name[:-1])} and {source_name[-1]}"
-            )
-        else:
-            raise RuntimeError("Can't define source class name")
-        if len(sorted_missing_attributes) <= 1:
-            attributes_string = f"attribute {''.join(sorted_missing_attributes)}"
-        else:
-            attributes_string = f"attributes {', '.join(sorted_missing_attributes[:-1])} and {sorted_missing_attributes[-1]}"
         raise TypeError(
-            f"Mapping {attributes_string} not found in {source_name_string}."
+            _format_missing_attrs_message(
+                frozenset(missing_attributes), self._get_source_class_name(source)
+            )
         )
 
     def _get_source_class_name(self, source: Union[SourceType, TS]) -> str:
@@ -463,7 +836,7 @@ class Mapper:
         source_name = self._get_source_class_name(source_instance)
         if len(missing_attrs) == 1:
             raise RuntimeError(
-                f"{target_type.__name__} requires argument {missing_attrs.pop()} which is excluded from mapping {source_name} -> {target_type.__name__}."
+                f"{target_type.__name__} requires argument {next(iter(missing_attrs))} which is excluded from mapping {source_name} -> {target_type.__name__}."
             )
         else:
             sorted_trouble_props_names = sorted(missing_attrs)
@@ -474,20 +847,22 @@ class Mapper:
 
     def _handle_mapping_error(
         self,
-        source: Union[TS, Tuple[TS, ...]],
+        source_type: SourceType,
         target_type: Type[TT],
         error: TypeError,
     ) -> NoReturn:
         """Handle mapping errors with descriptive messages."""
-        if isinstance(source, Iterable):
-            source_types = ", ".join(type(so).__name__ for so in source)
+        # The caller already resolved the source shape into a type or a tuple
+        # of types; no need to re-probe the instances through the ABC check.
+        if isinstance(source_type, tuple):
+            source_types = ", ".join(st.__name__ for st in source_type)
             raise TypeError(
-                f"Source objects ({source_types}) are missing required properties "
-                f"for target object {target_type.__name__}: {error}"
+                _ERR_AGG.format(srcs=source_types, tgt=target_type.__name__, err=error)
             )
         raise TypeError(
-            f"Source object {type(source).__name__} is missing required properties "
-            f"for target object {target_type.__name__}: {error}"
+            _ERR_SINGLE.format(
+                src=source_type.__name__, tgt=target_type.__name__, err=error
+            )
         )
 
     # endregion
@@ -1,31 +1,49 @@
 import unittest.mock
 from contextlib import nullcontext as does_not_raise
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 
 import pytest
 from pydantic import BaseModel, Field, ValidationError, field_validator
 from pydantic.fields import FieldInfo
 
 from pom import Mapper
-from pom.mapper import PydanticModelAdapter
+from pom.mapper import PydanticModelAdapter, _supports_bulk_set
+
+
+# Shared shapes are defined once at module scope instead of inside each
+# fixture call, so class bodies execute once per session and the mapper's
+# per-class caches stay warm across tests. Tests that need a fresh or
+# unusual shape still define their own classes locally.
+def _reversed_string(s: str) -> str:
+    return s[::-1]
+
+
+class SourceClassA:
+    def __init__(self, name: str, email: str):
+        self.name = name
+        self.email = email
+
+
+class SourceClassB:
+    def __init__(self, name: str, email: str):
+        self.name = name
+        self.email = email
+
+
+class TargetClass:
+    def __init__(self, name: str, email: str):
+        self.name = name
+        self.email = email
 
 
 @pytest.fixture
 def reversed_string():
-    def _reversed_string(s: str) -> str:
-        return s[::-1]
-
     return _reversed_string
 
 
 @pytest.fixture
 def simple_source_class_A():
-    class SourceClassA:
-        def __init__(self, name: str, email: str):
-            self.name = name
-            self.email = email
-
     return SourceClassA
 
 
@@ -39,21 +57,11 @@ def source_class_A_missing_attr():
 
 @pytest.fixture
 def simple_source_class_B():
-    class SourceClassB:
-        def __init__(self, name: str, email: str):
-            self.name = name
-            self.email = email
-
     return SourceClassB
 
 
 @pytest.fixture
 def simple_target_class():
-    class TargetClass:
-        def __init__(self, name: str, email: str):
-            self.name = name
-            self.email = email
-
     return TargetClass
 
 
@@ -62,6 +70,55 @@ def mapper():
     return Mapper()
 
 
+class SourceEmailOnly:
+    def __init__(self, email: str):
+        self.email = email
+
+
+class SourceEmailAge:
+    def __init__(self, email: str, age: int):
+        self.email = email
+        self.age = age
+
+
+class TargetNameEmailAge:
+    def __init__(self, name: str, email: str, age: int):
+        self.name = name
+        self.email = email
+        self.age = age
+
+
+class MultiSourceA:
+    name: str = None
+    email: str = None
+
+    def __init__(self, name: str, email: str):
+        self.name = name
+        self.email = email
+
+
+class MultiSourceB:
+    name: str = None
+    email: str = None
+
+    def __init__(self, name: str, email: str, age: int):
+        self.name = name
+        self.email = email
+        self.age = age
+
+
+@pytest.fixture(scope="module")
+def missing_property_mapper():
+    # Shared across the skip_init parametrizations: the mapping is
+    # registered once and each case is a bare map() call.
+    mapper = Mapper()
+    mapper.add_mapping(source=SourceEmailOnly, target=TargetClass)
+    mapper.add_mapping(
+        source=(SourceEmailOnly, SourceEmailAge), target=TargetNameEmailAge
+    )
+    return mapper
+
+
 class TestBasicMapping:
     """Tests for basic mapping functionality."""
 
@@ -389,6 +446,84 @@ class TestDataclassMapping:
         assert result.name == "ynnhoJ"
         assert result.email == source.email
 
+    def test_dataclass_mapping_ignores_classvar_fields(self, mapper):
+        """ClassVar pseudo-fields are not __init__ parameters and stay untouched."""
+
+        class Source:
+            def __init__(self, name: str, kind: str):
+                self.name = name
+                self.kind = kind
+
+        @dataclass
+        class Target:
+            name: str
+            kind: ClassVar[str] = "static"
+
+        source = Source("Johnny", "dynamic")
+
+        mapper.add_mapping(source=Source, target=Target)
+        result = mapper.map(source, Target)
+
+        assert isinstance(result, Target)
+        assert result.name == source.name
+        assert Target.kind == "static"
+
+    def test_dataclass_with_init_false_uses_real_signature(self, mapper):
+        """@dataclass(init=False) targets keep their hand-written __init__."""
+
+        class Source:
+            def __init__(self, name: str):
+                self.name = name
+
+        @dataclass(init=False)
+        class Target:
+            name: str
+
+            def __init__(self):
+                self.name = "default"
+
+        mapper.add_mapping(source=Source, target=Target)
+        result = mapper.map(Source("Johnny"), Target)
+
+        assert isinstance(result, Target)
+        assert result.name == "default"
+
+    def test_excluding_bare_classvar_is_not_required(self, mapper):
+        """A ClassVar without a value is never a required __init__ parameter."""
+
+        class Source:
+            def __init__(self, name: str):
+                self.name = name
+
+        @dataclass
+        class Target:
+            name: str
+            tag: "ClassVar[str]"
+
+        mapper.add_mapping(source=Source, target=Target, exclusions=["tag"])
+        result = mapper.map(Source("Johnny"), Target)
+
+        assert result.name == "Johnny"
+
+    def test_excluding_field_of_init_false_dataclass(self, mapper):
+        """Fields of an init=False dataclass are not required init params."""
+
+        class Source:
+            def __init__(self, name: str):
+                self.name = name
+
+        @dataclass(init=False)
+        class Target:
+            name: str
+
+            def __init__(self):
+                self.name = "default"
+
+        mapper.add_mapping(source=Source, target=Target, exclusions=["name"])
+        result = mapper.map(Source("Johnny"), Target)
+
+        assert result.name == "default"
+
 
 class TestErrorHandling:
     """Tests for error handling and validation."""
@@ -400,26 +535,19 @@ class TestErrorHandling:
             (False, True),
         ],
     )
-    def test_missing_required_properties(self, mapper, skip_init, should_raise):
+    def test_missing_required_properties(
+        self, missing_property_mapper, skip_init, should_raise
+    ):
         """Test handling of missing required properties."""
-
-        class Source:
-            def __init__(self, email: str):
-                self.email = email
-
-        class Target:
-            def __init__(self, name: str, email: str):
-                self.name = name
-                self.email = email
-
-        source = Source("johnny@mail.com")
-        mapper.add_mapping(source=Source, target=Target)
+        source = SourceEmailOnly("johnny@mail.com")
 
         if should_raise:
             with pytest.raises(TypeError):
-                mapper.map(source, Target, skip_init=skip_init)
+                missing_property_mapper.map(source, TargetClass, skip_init=skip_init)
         else:
-            result = mapper.map(source, Target, skip_init=skip_init)
+            result = missing_property_mapper.map(
+                source, TargetClass, skip_init=skip_init
+            )
             assert result.email == source.email
 
     def test_add_mapping_source_attr_validation(self, mapper):
@@ -896,37 +1024,19 @@ class TestAdvancedMapping:
         Verifies that properties from multiple sources are correctly combined in the target.
         """
 
-        class SourceA:
-            name: str = None
-            email: str = None
-
-            def __init__(self, name: str, email: str):
-                self.name = name
-                self.email = email
-                super().__init__()
-
-        class SourceB:
-            name: str = None
-            email: str = None
-
-            def __init__(self, name: str, email: str, age: int):
-                self.name = name
-                self.email = email
-                self.age = age
-                super().__init__()
-
         class Target:
             def __init__(self, name: str, email: str, age: int):
                 self.name = name
                 self.email = email
                 self.age = age
-                super().__init__()
 
-        a = SourceA("Johnny", "johnny@mail.com")
-        b = SourceB("Jodin", "johnyblaw@blawcloud.com", 30)
+        a = MultiSourceA("Johnny", "johnny@mail.com")
+        b = MultiSourceB("Jodin", "johnyblaw@blawcloud.com", 30)
 
         mapper.add_mapping(
-            source=(SourceA, SourceB), target=Target, mapping={"name": reversed_string}
+            source=(MultiSourceA, MultiSourceB),
+            target=Target,
+            mapping={"name": reversed_string},
         )
         c = mapper.map((a, b), Target)
         assert isinstance(c, Target)
@@ -943,38 +1053,20 @@ class TestAdvancedMapping:
         Verifies that both aggregated source properties and extra properties are correctly set.
         """
 
-        class SourceA:
-            name: str = None
-            email: str = None
-
-            def __init__(self, name: str, email: str):
-                self.name = name
-                self.email = email
-                super().__init__()
-
-        class SourceB:
-            name: str = None
-            email: str = None
-
-            def __init__(self, name: str, email: str, age: int):
-                self.name = name
-                self.email = email
-                self.age = age
-                super().__init__()
-
         class Target:
             def __init__(self, name: str, email: str, age: int, nickname: str):
                 self.name = name
                 self.email = email
                 self.age = age
                 self.nickname = nickname
-                super().__init__()
 
-        a = SourceA("Johnny", "johnny@mail.com")
-        b = SourceB("Jodin", "johnyblaw@blawcloud.com", 30)
+        a = MultiSourceA("Johnny", "johnny@mail.com")
+        b = MultiSourceB("Jodin", "johnyblaw@blawcloud.com", 30)
 
         mapper.add_mapping(
-            source=(SourceA, SourceB), target=Target, mapping={"name": reversed_string}
+            source=(MultiSourceA, MultiSourceB),
+            target=Target,
+            mapping={"name": reversed_string},
         )
         c = mapper.map((a, b), Target, extra={"nickname": "J"})
         assert isinstance(c, Target)
@@ -983,43 +1075,32 @@ class TestAdvancedMapping:
         assert c.age == b.age
         assert c.nickname == "J"
 
-    @pytest.mark.parametrize(
-        "skip_init, check_if_raised",
-        [(True, does_not_raise()), (False, pytest.raises(TypeError))],
-    )
-    def test_mapping_from_multiple_sources_with_missing_property(
-        self, mapper, skip_init, check_if_raised
+    def test_mapping_from_multiple_sources_with_missing_property_skip_init(
+        self, missing_property_mapper
     ):
         """
-        Test aggregate mapping behavior when required properties are missing from all sources.
+        Test aggregate mapping with required properties missing from all sources.
 
-        Verifies proper handling of missing properties based on skip_init parameter.
+        With skip_init=True the missing property is tolerated.
         """
+        a = SourceEmailOnly("johnny@mail.com")
+        b = SourceEmailAge("johnyblaw@blawcloud.com", 30)
 
-        class SourceA:
-            def __init__(self, email: str):
-                self.email = email
-                super().__init__()
+        missing_property_mapper.map((a, b), TargetNameEmailAge, skip_init=True)
 
-        class SourceB:
-            def __init__(self, email: str, age: int):
-                self.email = email
-                self.age = age
-                super().__init__()
-
-        class Target:
-            def __init__(self, name: str, email: str, age: int):
-                self.name = name
-                self.email = email
-                self.age = age
-                super().__init__()
+    def test_mapping_from_multiple_sources_with_missing_property_raises(
+        self, missing_property_mapper
+    ):
+        """
+        Test aggregate mapping with required properties missing from all sources.
 
-        a = SourceA("johnny@mail.com")
-        b = SourceB("johnyblaw@blawcloud.com", 30)
+        Without skip_init the target constructor fails with a TypeError.
+        """
+        a = SourceEmailOnly("johnny@mail.com")
+        b = SourceEmailAge("johnyblaw@blawcloud.com", 30)
 
-        mapper.add_mapping(source=(SourceA, SourceB), target=Target)
-        with check_if_raised:
-            c = mapper.map((a, b), Target, skip_init=skip_init)
+        with pytest.raises(TypeError):
+            missing_property_mapper.map((a, b), TargetNameEmailAge)
 
     def test_mapping_properties_with_different_names(self, mapper):
         """
@@ -1473,6 +1554,50 @@ class TestAdvancedMapping:
         assert result.new_name == "emaNtseT"
 
 
+class TestBatchMapping:
+    """Tests for mapping batches of source objects."""
+
+    def test_map_many(self, mapper, simple_source_class_A, simple_target_class):
+        """Test mapping a list of source objects in one call."""
+        sources = [
+            simple_source_class_A("Johnny", "johnny@mail.com"),
+            simple_source_class_A("Jodin", "jodin@mail.com"),
+        ]
+
+        mapper.add_mapping(source=simple_source_class_A, target=simple_target_class)
+        results = mapper.map_many(sources, simple_target_class)
+
+        assert len(results) == 2
+        assert all(isinstance(result, simple_target_class) for result in results)
+        assert [result.name for result in results] == ["Johnny", "Jodin"]
+        assert [result.email for result in results] == [
+            "johnny@mail.com",
+            "jodin@mail.com",
+        ]
+
+    def test_map_many_with_transformation_and_extra(self, mapper, reversed_string):
+        """Test that map_many applies transformations and extra to every item."""
+
+        class Source:
+            def __init__(self, name: str):
+                self.name = name
+
+        class Target:
+            def __init__(self, name: str, age: int):
+                self.name = name
+                self.age = age
+
+        sources = [Source("Johnny"), Source("Jodin")]
+
+        mapper.add_mapping(
+            source=Source, target=Target, mapping={"name": reversed_string}
+        )
+        results = mapper.map_many(sources, Target, extra={"age": 30})
+
+        assert [result.name for result in results] == ["ynnhoJ", "nidoJ"]
+        assert all(result.age == 30 for result in results)
+
+
 class TestPydanticMapping:
 
     def test_mapping_with_pydantic_models(self, mapper, reversed_string):
@@ -1895,6 +2020,58 @@ class TestPydanticModelAdapter:
 
 
 class TestPopoAdapter:
+    def test_supports_bulk_set_classification(self):
+        """Plain classes take the bulk __dict__.update write path; classes
+        with descriptors, __slots__, or a custom __setattr__ do not."""
+
+        class Plain:
+            def __init__(self, name: str):
+                self.name = name
+
+        class WithProperty:
+            @property
+            def name(self):
+                return self._name
+
+            @name.setter
+            def name(self, value):
+                self._name = value
+
+        class WithSetattr:
+            def __setattr__(self, name, value):
+                object.__setattr__(self, name, value)
+
+        class Slotted:
+            __slots__ = ("name",)
+
+        assert _supports_bulk_set(Plain)
+        assert not _supports_bulk_set(WithProperty)
+        assert not _supports_bulk_set(WithSetattr)
+        assert not _supports_bulk_set(Slotted)
+
+    def test_set_attrs_respects_property_setters(self, mapper):
+        """The setattr fallback still fires property setters on the target."""
+
+        class Source:
+            def __init__(self, name: str):
+                self.name = name
+
+        class Target:
+            def __init__(self, name: str):
+                self.name = name
+
+            @property
+            def name(self):
+                return self._name
+
+            @name.setter
+            def name(self, value):
+                self._name = value.upper()
+
+        result = mapper.map(Source("johnny"), Target, skip_init=True)
+
+        assert result.name == "JOHNNY"
+
     def test_popo_adapter_get_init_params_variations(self, mapper):
         class NoInit:
             pass